@@ -1,35 +1,107 @@
 # NewsHarvest Pro - Flask Web Version
 # Professional news data collection with web interface
 
-from flask import Flask, render_template_string, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, Response, stream_with_context
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 import json
 import io
 import csv
+import gzip
+import bisect
 import time
 import random
 import hashlib
 import re
+import string
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 from collections import Counter
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+import queue
+from news_sources import lookup_source
+
+try:
+    import ahocorasick  # Optional: single-pass bias keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # Optional: faster JSON serialization
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
+@dataclass
+class HarvestState:
+    """Progress and results of the current harvest job"""
+    active: bool = False
+    progress: float = 0
+    articles_found: int = 0
+    articles_processed: int = 0
+    articles_accepted: int = 0
+    current_status: str = 'Ready'
+    collected_data: list = field(default_factory=list)
+    quality_metrics: dict = field(default_factory=dict)
+    dataset_etag: str = ''
+    
+    # Fields sent with progress updates; collected_data is served once by /api/results
+    PROGRESS_FIELDS = (
+        'active', 'progress', 'articles_found', 'articles_processed',
+        'articles_accepted', 'current_status', 'quality_metrics'
+    )
+    
+    def __post_init__(self):
+        self._listeners = []
+        self._lock = threading.Lock()  # Keeps multi-field updates and snapshots consistent
+    
+    def to_dict(self):
+        """Snapshot of the progress fields for JSON responses"""
+        with self._lock:
+            return {name: getattr(self, name) for name in self.PROGRESS_FIELDS}
+    
+    def update(self, **changes):
+        """Apply field changes and push the new state to stream listeners"""
+        with self._lock:
+            for name, value in changes.items():
+                setattr(self, name, value)
+            snapshot = {name: getattr(self, name) for name in self.PROGRESS_FIELDS}
+            listeners = list(self._listeners)
+        
+        for listener in listeners:
+            while True:
+                try:
+                    listener.put_nowait(snapshot)
+                    break
+                except queue.Full:
+                    # Slow listener: drop its oldest snapshot so the newest, such as
+                    # the final active=False one, is never lost
+                    try:
+                        listener.get_nowait()
+                    except queue.Empty:
+                        pass
+    
+    def subscribe(self):
+        """Register a bounded queue that receives a snapshot on every update"""
+        listener = queue.Queue(maxsize=64)
+        with self._lock:
+            self._listeners.append(listener)
+        return listener
+    
+    def unsubscribe(self, listener):
+        """Stop delivering updates to a listener queue"""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
 # Global status tracking
-harvesting_status = {
-    'active': False,
-    'progress': 0,
-    'articles_found': 0,
-    'articles_processed': 0,
-    'articles_accepted': 0,
-    'current_status': 'Ready',
-    'collected_data': [],
-    'quality_metrics': {}
-}
+harvesting_status = HarvestState()
 
 class NewsHarvester:
     """Professional news harvesting engine"""
@@ -39,6 +111,29 @@ class NewsHarvester:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
+        # Number of article pages fetched concurrently, overall and per site
+        self.max_workers = 8
+        self.max_requests_per_host = 4
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
+        
+        # Persistent session so repeated fetches from one site reuse connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=8, pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Near-duplicate detection: SimHash over the title and content prefix, max differing bits
+        self.simhash_prefix_chars = 2000
+        self.simhash_max_distance = 3
+        # Per bit, the byte values with that bit clear; deleting them from a column of
+        # hash bytes leaves the count of features that set the bit
+        self._simhash_bit_clear = [bytes(v for v in range(256) if not v >> bit & 1) for bit in range(8)]
+        
         # Bias detection keywords
         self.bias_keywords = {
             'political_left': ['progressive', 'liberal', 'democrat', 'climate change', 'social justice'],
@@ -48,12 +143,76 @@ class NewsHarvester:
             'geographic_bias': ['urban', 'rural', 'city', 'countryside'],
             'economic_bias': ['wealthy', 'poor', 'working class', 'elite']
         }
+        
+        # Aho-Corasick automaton over all bias keywords, when pyahocorasick is installed
+        self._bias_automaton = None
+        if ahocorasick is not None:
+            self._bias_automaton = ahocorasick.Automaton()
+            for category, keywords in self.bias_keywords.items():
+                for keyword in keywords:
+                    self._bias_automaton.add_word(keyword, category)
+            self._bias_automaton.make_automaton()
+        
+        # Deletes ASCII capitals; the length difference gives the caps count
+        self._uppercase_table = str.maketrans('', '', string.ascii_uppercase)
+        
+        # URL patterns, compiled once instead of per link
+        article_patterns = [
+            r'/news/', r'/article/', r'/\d{4}/\d{2}/', r'/world/', 
+            r'/politics/', r'/technology/', r'/business/', r'/health/',
+            r'/science/', r'/environment/'
+        ]
+        exclude_patterns = [
+            r'/live/', r'/sport/', r'/weather/', r'/search', r'#', 
+            r'javascript:', r'/video/', r'/gallery/', r'/podcast/'
+        ]
+        self._article_re = re.compile('|'.join(article_patterns))
+        self._exclude_re = re.compile('|'.join(exclude_patterns))
+        
+        # Extraction selectors, compiled once instead of per article
+        self._title_selectors = [sv.compile(s) for s in [
+            'h1[data-testid="headline"]',  # BBC specific
+            'h1.story-headline',           # Common pattern
+            'h1',                          # Fallback
+            '.headline h1',                # Nested
+            '.article-title',              # Alternative
+            '[data-component="headline"]'  # Data attribute
+        ]]
+        self._content_selectors = [sv.compile(s) for s in [
+            '[data-component="text-block"] p',  # BBC specific
+            'article p',                        # Semantic HTML
+            '.story-body p',                    # Common class
+            '.article-content p',               # Alternative
+            '.content p',                       # Generic
+            '.post-content p'                   # Blog style
+        ]]
+        self._author_selectors = [sv.compile(s) for s in [
+            '.byline', '.author', '[data-component="byline"]',
+            '.article-author', '[rel="author"]'
+        ]]
+        self._date_selectors = [sv.compile(s) for s in [
+            'time[datetime]', '[data-testid="timestamp"]',
+            '.date', '.published', '.article-date'
+        ]]
+        
+        # Union of the title/author/date selectors, walked once per article
+        self._metadata_selectors = self._title_selectors + self._author_selectors + self._date_selectors
+        self._metadata_union = sv.compile(', '.join(sel.pattern for sel in self._metadata_selectors))
+    
+    def _host_slot(self, url):
+        """Semaphore bounding concurrent requests to the URL's host"""
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_requests_per_host)
+            return self._host_slots[host]
     
     def get_webpage(self, url):
         """Fetch webpage with error handling and politeness"""
         try:
-            time.sleep(random.uniform(1, 2))  # Be respectful
-            response = requests.get(url, headers=self.headers, timeout=10)
+            with self._host_slot(url):
+                time.sleep(random.uniform(1, 2))  # Be respectful
+                response = self.session.get(url, timeout=10)
             return response.text if response.status_code == 200 else None
         except Exception as e:
             print(f"Error fetching {url}: {e}")
@@ -65,48 +224,57 @@ class NewsHarvester:
         if not html_content:
             return []
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Only anchors are needed for discovery, so skip building the rest of the tree
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=SoupStrainer('a', href=True))
         all_links = soup.find_all('a', href=True)
         
         article_urls = []
-        base_domain = urlparse(homepage_url).netloc
+        seen_urls = set()
+        base = urlparse(homepage_url)
+        base_domain = base.netloc
+        site_root = f"{base.scheme}://{base.netloc}"
         
         for link in all_links:
             href = link['href']
-            absolute_url = urljoin(homepage_url, href)
+            
+            # Excluded links stay excluded once resolved, so skip urljoin for them
+            if self._exclude_re.search(href):
+                continue
+            
+            # Root-relative and absolute links need no full urljoin
+            if href.startswith('/') and not href.startswith('//'):
+                absolute_url = site_root + href
+            elif href.startswith(('http://', 'https://')):
+                absolute_url = href
+            else:
+                absolute_url = urljoin(homepage_url, href)
+            if absolute_url in seen_urls:
+                continue
+            seen_urls.add(absolute_url)
             
             if self.is_article_url(absolute_url, base_domain):
                 article_urls.append(absolute_url)
+                if len(article_urls) >= 30:  # Limit for performance
+                    break
         
-        return list(set(article_urls))[:30]  # Limit for performance
+        return article_urls
     
     def is_article_url(self, url, base_domain):
         """Check if URL pattern matches news articles"""
         if base_domain not in url:
             return False
         
-        # Patterns that indicate article URLs
-        article_patterns = [
-            r'/news/', r'/article/', r'/\d{4}/\d{2}/', r'/world/', 
-            r'/politics/', r'/technology/', r'/business/', r'/health/',
-            r'/science/', r'/environment/'
-        ]
-        
-        # Patterns to exclude
-        exclude_patterns = [
-            r'/live/', r'/sport/', r'/weather/', r'/search', r'#', 
-            r'javascript:', r'/video/', r'/gallery/', r'/podcast/'
-        ]
-        
-        # Check if URL matches article patterns
-        for pattern in article_patterns:
-            if re.search(pattern, url):
-                # Make sure it doesn't match exclude patterns
-                for exclude in exclude_patterns:
-                    if re.search(exclude, url):
-                        return False
-                return True
-        return False
+        # Must match an article pattern and none of the exclude patterns
+        return self._article_re.search(url) is not None and self._exclude_re.search(url) is None
+    
+    def _first_matches(self, soup):
+        """Map each metadata selector to its first matching element, in one traversal"""
+        first = {}
+        for element in self._metadata_union.iselect(soup):
+            for selector in self._metadata_selectors:
+                if selector.pattern not in first and selector.match(element):
+                    first[selector.pattern] = element
+        return first
     
     def scrape_article(self, url):
         """Extract article content from URL"""
@@ -114,66 +282,41 @@ class NewsHarvester:
         if not html_content:
             return None
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
+        
+        # Collect title/author/date candidates in a single tree walk
+        first_matches = self._first_matches(soup)
         
         # Extract title using multiple selectors
         title = None
-        title_selectors = [
-            'h1[data-testid="headline"]',  # BBC specific
-            'h1.story-headline',           # Common pattern
-            'h1',                          # Fallback
-            '.headline h1',                # Nested
-            '.article-title',              # Alternative
-            '[data-component="headline"]'  # Data attribute
-        ]
-        
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text(strip=True):
-                title = element.get_text(strip=True)
+        for selector in self._title_selectors:
+            element = first_matches.get(selector.pattern)
+            if element and (text := element.get_text(strip=True)):
+                title = text
                 break
         
         # Extract content using multiple strategies
         content_paragraphs = []
-        content_selectors = [
-            '[data-component="text-block"] p',  # BBC specific
-            'article p',                        # Semantic HTML
-            '.story-body p',                    # Common class
-            '.article-content p',               # Alternative
-            '.content p',                       # Generic
-            '.post-content p'                   # Blog style
-        ]
-        
-        for selector in content_selectors:
-            paragraphs = soup.select(selector)
+        for selector in self._content_selectors:
+            paragraphs = selector.select(soup)
             if paragraphs and len(paragraphs) >= 3:
-                content_paragraphs = [p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)]
+                content_paragraphs = [text for p in paragraphs if (text := p.get_text(strip=True))]
                 break
         
         content = ' '.join(content_paragraphs)
         
         # Extract author
         author = None
-        author_selectors = [
-            '.byline', '.author', '[data-component="byline"]',
-            '.article-author', '[rel="author"]'
-        ]
-        
-        for selector in author_selectors:
-            element = soup.select_one(selector)
+        for selector in self._author_selectors:
+            element = first_matches.get(selector.pattern)
             if element:
                 author = element.get_text(strip=True)
                 break
         
         # Extract publish date
         publish_date = None
-        date_selectors = [
-            'time[datetime]', '[data-testid="timestamp"]',
-            '.date', '.published', '.article-date'
-        ]
-        
-        for selector in date_selectors:
-            element = soup.select_one(selector)
+        for selector in self._date_selectors:
+            element = first_matches.get(selector.pattern)
             if element:
                 publish_date = element.get('datetime') or element.get_text(strip=True)
                 break
@@ -188,6 +331,41 @@ class NewsHarvester:
             'word_count': len(content.split()) if content else 0
         }
     
+    def _simhash(self, text, title=''):
+        """64-bit SimHash over the text's word 5-gram shingles and the title's words"""
+        tokens = text.encode('utf-8', 'ignore').split()
+        shingles = set(map(b' '.join, zip(tokens, tokens[1:], tokens[2:], tokens[3:], tokens[4:])))
+        shingles = shingles or {b' '.join(tokens)}
+        title_words = set(title.encode('utf-8', 'ignore').split())
+        # Title words together weigh as much as the body, so distinct stories behind the
+        # same boilerplate opening stay apart
+        title_weight = max(len(shingles) // len(title_words), 1) if title_words else 0
+        
+        # Hash every feature once; byte i of each 8-byte digest lands in column i
+        shingle_digests = b''.join([hashlib.blake2b(s, digest_size=8).digest() for s in shingles])
+        title_digests = b''.join([hashlib.blake2b(w, digest_size=8).digest() for w in title_words])
+        votes = len(shingles) + title_weight * len(title_words)
+        
+        fingerprint = 0
+        for position in range(8):
+            shingle_column = shingle_digests[position::8]
+            title_column = title_digests[position::8]
+            for bit, clear in enumerate(self._simhash_bit_clear):
+                ones = (len(shingle_column.translate(None, clear))
+                        + title_weight * len(title_column.translate(None, clear)))
+                if 2 * ones > votes:
+                    fingerprint |= 1 << (8 * position + bit)
+        return fingerprint
+    
+    def _is_near_duplicate(self, fingerprint, seen_hashes):
+        """Check a fingerprint against accepted ones sharing any 16-bit block"""
+        # Fingerprints within 3 bits of each other always agree on at least one of the 4 blocks
+        for block in range(4):
+            for other in seen_hashes.get((block, fingerprint >> (16 * block) & 0xFFFF), ()):
+                if bin(fingerprint ^ other).count('1') <= self.simhash_max_distance:
+                    return True
+        return False
+    
     def calculate_quality_score(self, article):
         """Calculate comprehensive quality score (0-1)"""
         score = 0.0
@@ -220,7 +398,8 @@ class NewsHarvester:
         
         # Language quality (0-0.10)
         if content:
-            caps_ratio = sum(1 for c in content if c.isupper()) / len(content) if content else 0
+            caps_count = len(content) - len(content.translate(self._uppercase_table))
+            caps_ratio = caps_count / len(content)
             if caps_ratio <= 0.05:  # Less than 5% caps
                 score += 0.10
         
@@ -232,19 +411,23 @@ class NewsHarvester:
         
         return min(score, 1.0)
     
-    def analyze_bias(self, text):
-        """Comprehensive bias analysis"""
-        text_lower = text.lower()
-        word_count = len(text.split())
-        
-        bias_scores = {}
-        total_bias_indicators = 0
+    def analyze_bias(self, text_lower, word_count=None):
+        """Comprehensive bias analysis of already-lowercased text"""
+        if word_count is None:  # Callers that already counted words skip the split
+            word_count = len(text_lower.split())
         
         # Count bias indicators by category
-        for category, keywords in self.bias_keywords.items():
-            count = sum(text_lower.count(keyword) for keyword in keywords)
-            bias_scores[category] = count
-            total_bias_indicators += count
+        if self._bias_automaton is not None:
+            # One scan of the text finds every keyword occurrence
+            bias_scores = dict.fromkeys(self.bias_keywords, 0)
+            for _, category in self._bias_automaton.iter(text_lower):
+                bias_scores[category] += 1
+        else:
+            bias_scores = {
+                category: sum(text_lower.count(keyword) for keyword in keywords)
+                for category, keywords in self.bias_keywords.items()
+            }
+        total_bias_indicators = sum(bias_scores.values())
         
         # Calculate bias density (percentage)
         bias_density = (total_bias_indicators / word_count * 100) if word_count > 0 else 0
@@ -279,101 +462,114 @@ class NewsHarvester:
         global harvesting_status
         
         try:
-            harvesting_status['active'] = True
-            harvesting_status['current_status'] = 'Discovering articles...'
+            harvesting_status.update(active=True, current_status='Discovering articles...')
             
             # Discover article URLs
             article_urls = self.find_article_urls(url)
-            harvesting_status['articles_found'] = len(article_urls)
+            harvesting_status.update(articles_found=len(article_urls))
             
             if not article_urls:
-                harvesting_status['current_status'] = 'No articles found on this page'
+                harvesting_status.update(current_status='No articles found on this page')
                 return []
             
             collected_articles = []
             processed = 0
-            seen_hashes = set()
+            seen_hashes = {}  # (block index, 16-bit block) -> SimHash fingerprints
             
-            # Process each article URL
-            for article_url in article_urls[:max_articles * 2]:  # Try extra URLs to get enough good ones
-                if not harvesting_status['active']:  # Allow cancellation
-                    break
-                
-                processed += 1
-                harvesting_status['articles_processed'] = processed
-                harvesting_status['current_status'] = f'Processing article {processed}...'
-                
-                # Scrape article content
-                article = self.scrape_article(article_url)
-                if not article:
-                    continue
-                
-                # Add source information
-                domain = urlparse(article_url).netloc.lower()
-                if 'bbc' in domain:
-                    article['source'] = 'BBC'
-                elif 'reuters' in domain:
-                    article['source'] = 'Reuters'
-                elif 'guardian' in domain:
-                    article['source'] = 'Guardian'
-                elif 'techcrunch' in domain:
-                    article['source'] = 'TechCrunch'
-                elif 'cnn' in domain:
-                    article['source'] = 'CNN'
-                else:
-                    article['source'] = domain.replace('www.', '').title()
-                
-                # Basic quality validation
-                if not article['title'] or len(article['title']) < 10:
-                    continue
-                if article['word_count'] < 100:
-                    continue
-                
-                # Calculate quality score
-                quality_score = self.calculate_quality_score(article)
-                if quality_score < quality_threshold:
-                    continue
-                
-                article['quality_score'] = quality_score
-                
-                # Perform bias analysis
-                combined_text = f"{article['title']} {article['content']}"
-                bias_analysis = self.analyze_bias(combined_text)
-                article['bias_analysis'] = bias_analysis
-                
-                # Duplicate detection
-                content_hash = hashlib.md5(f"{article['title']}{article['content'][:500]}".encode()).hexdigest()
-                if content_hash in seen_hashes:
-                    continue
-                seen_hashes.add(content_hash)
-                article['content_hash'] = content_hash
-                
-                # Add to collection
-                collected_articles.append(article)
-                harvesting_status['articles_accepted'] = len(collected_articles)
-                
-                # Update progress
-                progress = min((processed / max_articles) * 100, 100)
-                harvesting_status['progress'] = progress
+            # Fetch candidate articles concurrently and process them as they arrive
+            candidate_urls = article_urls[:max_articles * 2]  # Try extra URLs to get enough good ones
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self.scrape_article, candidate): candidate for candidate in candidate_urls}
+                for future in as_completed(futures):
+                    if not harvesting_status.active:  # Allow cancellation
+                        break
+                    
+                    article_url = futures[future]
+                    article = future.result()
+                    
+                    processed += 1
+                    harvesting_status.update(
+                        articles_processed=processed,
+                        current_status=f'Processing article {processed}...'
+                    )
+                    
+                    if not article:
+                        continue
+                    
+                    # Add source information
+                    domain = urlparse(article_url).hostname or ''
+                    if domain.startswith('www.'):
+                        domain = domain[4:]
+                    article['source'] = lookup_source(domain) or domain.title()
+                    
+                    # Basic quality validation
+                    if not article['title'] or len(article['title']) < 10:
+                        continue
+                    if article['word_count'] < 100:
+                        continue
+                    
+                    # Lowercase once; the lowered content is shared by the later analyses
+                    title_lower = article['title'].lower()
+                    content_lower = article['content'].lower()
+                    
+                    # Near-duplicate detection (e.g. syndicated wire copy) before any scoring
+                    fingerprint = self._simhash(content_lower[:self.simhash_prefix_chars], title_lower)
+                    if self._is_near_duplicate(fingerprint, seen_hashes):
+                        continue
+                    
+                    # Calculate quality score
+                    quality_score = self.calculate_quality_score(article)
+                    if quality_score < quality_threshold:
+                        continue
+                    
+                    article['quality_score'] = quality_score
+                    
+                    # Perform bias analysis
+                    combined_words = article['word_count'] + len(article['title'].split())
+                    bias_analysis = self.analyze_bias(f"{title_lower} {content_lower}", combined_words)
+                    article['bias_analysis'] = bias_analysis
+                    
+                    # Remember the fingerprint under each of its 16-bit blocks
+                    for block in range(4):
+                        seen_hashes.setdefault((block, fingerprint >> (16 * block) & 0xFFFF), []).append(fingerprint)
+                    article['content_hash'] = f"{fingerprint:016x}"
+                    
+                    # Add to collection
+                    collected_articles.append(article)
+                    
+                    # Update progress
+                    progress = min((processed / max_articles) * 100, 100)
+                    harvesting_status.update(articles_accepted=len(collected_articles), progress=progress)
+                    
+                    # Stop if we have enough articles
+                    if len(collected_articles) >= max_articles:
+                        break
                 
-                # Stop if we have enough articles
-                if len(collected_articles) >= max_articles:
-                    break
+                # Drop fetches that have not started yet when stopping early
+                for future in futures:
+                    future.cancel()
             
             # Calculate final metrics
+            quality_metrics = {}
+            dataset_etag = ''
             if collected_articles:
-                total_quality = sum(a['quality_score'] for a in collected_articles)
-                avg_quality = total_quality / len(collected_articles)
+                # Single pass over the collection for all aggregates
+                total_quality = total_bias = 0.0
+                total_words = balanced_articles = 0
+                dataset_hash = hashlib.blake2b(digest_size=8)  # Identifies this dataset for download ETags
+                for a in collected_articles:
+                    dataset_hash.update(f"{a['content_hash']}{a['scraped_at']}".encode())
+                    bias = a['bias_analysis']
+                    total_quality += a['quality_score']
+                    total_bias += bias['bias_density']
+                    total_words += a['word_count']
+                    balanced_articles += bias['is_balanced']
                 
-                total_bias = sum(a['bias_analysis']['bias_density'] for a in collected_articles)
+                avg_quality = total_quality / len(collected_articles)
                 avg_bias = total_bias / len(collected_articles)
-                
-                total_words = sum(a['word_count'] for a in collected_articles)
                 avg_words = total_words / len(collected_articles)
                 
-                balanced_articles = sum(1 for a in collected_articles if a['bias_analysis']['is_balanced'])
-                
-                harvesting_status['quality_metrics'] = {
+                quality_metrics = {
                     'total_articles': len(collected_articles),
                     'avg_quality_score': round(avg_quality, 3),
                     'avg_bias_density': round(avg_bias, 2),
@@ -381,538 +577,126 @@ class NewsHarvester:
                     'balanced_articles': balanced_articles,
                     'balance_percentage': round((balanced_articles / len(collected_articles)) * 100, 1)
                 }
+                dataset_etag = dataset_hash.hexdigest()
             
-            harvesting_status['collected_data'] = collected_articles
-            harvesting_status['current_status'] = f'✅ Complete! Collected {len(collected_articles)} high-quality articles'
+            harvesting_status.update(
+                quality_metrics=quality_metrics,
+                collected_data=collected_articles,
+                dataset_etag=dataset_etag,
+                current_status=f'✅ Complete! Collected {len(collected_articles)} high-quality articles'
+            )
             
             return collected_articles
             
         except Exception as e:
-            harvesting_status['current_status'] = f'❌ Error: {str(e)}'
+            harvesting_status.update(current_status=f'❌ Error: {str(e)}')
             return []
         finally:
-            harvesting_status['active'] = False
+            harvesting_status.update(active=False)
 
 # Initialize harvester
 harvester = NewsHarvester()
 
-# HTML Template for web interface
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>NewsHarvest Pro - Professional News Data Collection</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        
-        body { 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh; 
-            padding: 20px; 
-        }
-        
-        .container { 
-            max-width: 900px; 
-            margin: 0 auto; 
-            background: rgba(255, 255, 255, 0.95); 
-            border-radius: 15px; 
-            padding: 40px; 
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1); 
-        }
-        
-        h1 { 
-            color: #2c3e50; 
-            margin-bottom: 10px; 
-            text-align: center; 
-            font-size: 2.5em;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-        }
-        
-        .subtitle {
-            text-align: center; 
-            color: #7f8c8d; 
-            margin-bottom: 40px; 
-            font-size: 1.1em;
-        }
-        
-        .features {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }
-        
-        .feature {
-            text-align: center;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 10px;
-            border: 2px solid transparent;
-            transition: all 0.3s;
-        }
-        
-        .feature:hover {
-            border-color: #3498db;
-            transform: translateY(-2px);
-        }
-        
-        .feature-icon {
-            font-size: 2em;
-            margin-bottom: 10px;
-        }
-        
-        .input-section {
-            background: #f8f9fa;
-            border-radius: 12px;
-            padding: 30px;
-            margin-bottom: 30px;
-            border: 2px solid #e9ecef;
-        }
-        
-        .input-group { 
-            margin-bottom: 20px; 
-        }
-        
-        label { 
-            display: block; 
-            margin-bottom: 8px; 
-            font-weight: 600; 
-            color: #2c3e50; 
-            font-size: 14px;
-        }
-        
-        input, select { 
-            width: 100%; 
-            padding: 12px 15px; 
-            border: 2px solid #ddd; 
-            border-radius: 8px; 
-            font-size: 16px; 
-            transition: border-color 0.3s;
-        }
-        
-        input:focus, select:focus { 
-            border-color: #3498db; 
-            outline: none; 
-            box-shadow: 0 0 0 3px rgba(52, 152, 219, 0.1);
-        }
-        
-        .harvest-btn { 
-            background: linear-gradient(135deg, #27ae60 0%, #2ecc71 100%);
-            color: white; 
-            border: none; 
-            padding: 15px 40px; 
-            font-size: 18px; 
-            border-radius: 50px; 
-            cursor: pointer; 
-            width: 100%; 
-            margin-top: 20px;
-            transition: all 0.3s;
-            box-shadow: 0 5px 15px rgba(46, 204, 113, 0.3);
-        }
-        
-        .harvest-btn:hover { 
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(46, 204, 113, 0.4);
-        }
-        
-        .harvest-btn:disabled { 
-            background: #bdc3c7; 
-            cursor: not-allowed; 
-            transform: none;
-            box-shadow: none;
-        }
-        
-        .progress-section { 
-            display: none; 
-            margin: 30px 0; 
-            padding: 30px; 
-            background: #fff; 
-            border-radius: 12px; 
-            border: 2px solid #3498db;
-        }
-        
-        .progress-bar { 
-            width: 100%; 
-            height: 20px; 
-            background: #ecf0f1; 
-            border-radius: 10px; 
-            overflow: hidden; 
-            margin-bottom: 15px; 
-        }
-        
-        .progress-fill { 
-            height: 100%; 
-            background: linear-gradient(90deg, #3498db 0%, #2ecc71 100%);
-            width: 0%; 
-            transition: width 0.3s; 
-            position: relative;
-        }
-        
-        .progress-fill::after {
-            content: '';
-            position: absolute;
-            top: 0; left: 0; right: 0; bottom: 0;
-            background: linear-gradient(45deg, transparent 35%, rgba(255,255,255,0.3) 50%, transparent 65%);
-            animation: progress-shine 1.5s infinite;
-        }
-        
-        @keyframes progress-shine {
-            0% { transform: translateX(-100%); }
-            100% { transform: translateX(100%); }
-        }
-        
-        .status-text {
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 20px;
-            text-align: center;
-        }
-        
-        .stats { 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); 
-            gap: 15px; 
-            margin-top: 20px; 
-        }
-        
-        .stat { 
-            text-align: center; 
-            padding: 20px; 
-            background: linear-gradient(135deg, #74b9ff 0%, #0984e3 100%);
-            color: white; 
-            border-radius: 10px; 
-            box-shadow: 0 5px 15px rgba(116, 185, 255, 0.3);
-        }
-        
-        .stat-number { 
-            font-size: 28px; 
-            font-weight: bold; 
-            margin-bottom: 5px;
-        }
-        
-        .stat-label { 
-            font-size: 12px; 
-            opacity: 0.9;
-        }
-        
-        .results { 
-            display: none; 
-            margin-top: 30px; 
-        }
-        
-        .download-buttons { 
-            display: flex; 
-            gap: 15px; 
-            margin-bottom: 30px; 
-            flex-wrap: wrap;
-        }
-        
-        .download-btn { 
-            flex: 1; 
-            min-width: 150px;
-            background: linear-gradient(135deg, #8e44ad 0%, #9b59b6 100%);
-            color: white;
-            border: none;
-            padding: 12px 20px;
-            border-radius: 25px;
-            cursor: pointer;
-            font-weight: 600;
-            transition: all 0.3s;
-        }
-        
-        .download-btn:hover { 
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(155, 89, 182, 0.3);
-        }
-        
-        .metrics { 
-            background: #f8f9fa; 
-            padding: 25px; 
-            border-radius: 12px; 
-        }
-        
-        .metrics h4 {
-            margin-bottom: 20px;
-            color: #2c3e50;
-            font-size: 1.2em;
-        }
-        
-        .metric-row { 
-            display: flex; 
-            justify-content: space-between; 
-            padding: 12px 0; 
-            border-bottom: 1px solid #dee2e6; 
-        }
-        
-        .metric-row:last-child { 
-            border-bottom: none; 
-        }
-        
-        .metric-label {
-            font-weight: 600;
-            color: #34495e;
-        }
-        
-        .metric-value {
-            font-weight: bold;
-            color: #27ae60;
-        }
-        
-        @media (max-width: 768px) {
-            .container { padding: 20px; }
-            .download-buttons { flex-direction: column; }
-            .download-btn { min-width: auto; }
-            .stats { grid-template-columns: repeat(2, 1fr); }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🗞️ NewsHarvest Pro</h1>
-        <p class="subtitle">Professional news data collection with quality control and bias analysis</p>
-        
-        <div class="features">
-            <div class="feature">
-                <div class="feature-icon">🔍</div>
-                <div><strong>Smart Discovery</strong><br>Automatically finds articles</div>
-            </div>
-            <div class="feature">
-                <div class="feature-icon">⚖️</div>
-                <div><strong>Bias Analysis</strong><br>6-category bias detection</div>
-            </div>
-            <div class="feature">
-                <div class="feature-icon">🏆</div>
-                <div><strong>Quality Control</strong><br>Multi-stage validation</div>
-            </div>
-            <div class="feature">
-                <div class="feature-icon">📊</div>
-                <div><strong>Real-time Progress</strong><br>Live collection tracking</div>
-            </div>
-        </div>
-        
-        <div class="input-section">
-            <div class="input-group">
-                <label for="newsUrl">News Website URL:</label>
-                <input type="url" id="newsUrl" placeholder="https://www.bbc.com/news" value="https://www.bbc.com/news">
-            </div>
-            
-            <div class="input-group">
-                <label for="maxArticles">Number of Articles:</label>
-                <select id="maxArticles">
-                    <option value="5">5 articles (Quick test)</option>
-                    <option value="10" selected>10 articles (Recommended)</option>
-                    <option value="15">15 articles (Comprehensive)</option>
-                    <option value="20">20 articles (Research)</option>
-                </select>
-            </div>
-            
-            <div class="input-group">
-                <label for="qualityThreshold">Quality Threshold:</label>
-                <select id="qualityThreshold">
-                    <option value="0.4">0.4 - Inclusive (accepts more articles)</option>
-                    <option value="0.6" selected>0.6 - Balanced (recommended)</option>
-                    <option value="0.8">0.8 - High quality only</option>
-                </select>
-            </div>
-            
-            <button class="harvest-btn" id="harvestBtn" onclick="startHarvesting()">🚀 Start Harvesting</button>
-        </div>
-        
-        <div class="progress-section" id="progressSection">
-            <h3>📊 Collection Progress</h3>
-            <div class="progress-bar">
-                <div class="progress-fill" id="progressFill"></div>
-            </div>
-            <div class="status-text" id="statusText">Initializing...</div>
-            
-            <div class="stats">
-                <div class="stat">
-                    <div class="stat-number" id="articlesFound">0</div>
-                    <div class="stat-label">Articles Found</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-number" id="articlesProcessed">0</div>
-                    <div class="stat-label">Articles Processed</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-number" id="articlesAccepted">0</div>
-                    <div class="stat-label">Articles Accepted</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-number" id="avgQuality">0.0</div>
-                    <div class="stat-label">Avg Quality</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="results" id="resultsSection">
-            <h3>✅ Collection Complete!</h3>
-            
-            <div class="download-buttons">
-                <button class="download-btn" onclick="downloadDataset('json')">📄 Download JSON</button>
-                <button class="download-btn" onclick="downloadDataset('csv')">📊 Download CSV</button>
-                <button class="download-btn" onclick="downloadDataset('report')">📋 Quality Report</button>
-            </div>
-            
-            <div class="metrics">
-                <h4>📈 Dataset Quality Metrics</h4>
-                <div class="metric-row">
-                    <span class="metric-label">Total Articles Collected:</span>
-                    <span class="metric-value" id="finalCount">0</span>
-                </div>
-                <div class="metric-row">
-                    <span class="metric-label">Average Quality Score:</span>
-                    <span class="metric-value" id="finalQuality">0.0</span>
-                </div>
-                <div class="metric-row">
-                    <span class="metric-label">Average Bias Density:</span>
-                    <span class="metric-value" id="finalBias">0.0%</span>
-                </div>
-                <div class="metric-row">
-                    <span class="metric-label">Balanced Articles:</span>
-                    <span class="metric-value" id="finalBalance">0/0 (0%)</span>
-                </div>
-                <div class="metric-row">
-                    <span class="metric-label">Average Word Count:</span>
-                    <span class="metric-value" id="finalWords">0</span>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        let harvestingActive = false;
-        let statusInterval;
-
-        function startHarvesting() {
-            if (harvestingActive) return;
-            
-            const url = document.getElementById('newsUrl').value;
-            const maxArticles = parseInt(document.getElementById('maxArticles').value);
-            const qualityThreshold = parseFloat(document.getElementById('qualityThreshold').value);
-
-            if (!url || !url.startsWith('http')) {
-                alert('Please enter a valid news website URL');
-                return;
-            }
-
-            harvestingActive = true;
-            document.getElementById('harvestBtn').disabled = true;
-            document.getElementById('harvestBtn').textContent = '🔄 Harvesting...';
-            document.getElementById('progressSection').style.display = 'block';
-            document.getElementById('resultsSection').style.display = 'none';
-
-            // Start harvesting via API
-            fetch('/api/harvest', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    url: url,
-                    max_articles: maxArticles,
-                    quality_threshold: qualityThreshold
-                })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.error) {
-                    alert('Error: ' + data.error);
-                    resetInterface();
-                    return;
-                }
-                
-                // Start status checking
-                statusInterval = setInterval(checkStatus, 1000);
-            })
-            .catch(error => {
-                alert('Failed to start harvesting: ' + error);
-                resetInterface();
-            });
-        }
-
-        function checkStatus() {
-            fetch('/api/status')
-                .then(response => response.json())
-                .then(status => {
-                    updateProgress(status.progress);
-                    updateStats(status);
-                    document.getElementById('statusText').textContent = status.current_status;
-                    
-                    if (!status.active && status.collected_data.length > 0) {
-                        completeHarvesting(status);
-                    }
-                })
-                .catch(error => console.error('Status check error:', error));
-        }
-
-        function updateProgress(percentage) {
-            document.getElementById('progressFill').style.width = percentage + '%';
-        }
-
-        function updateStats(status) {
-            document.getElementById('articlesFound').textContent = status.articles_found;
-            document.getElementById('articlesProcessed').textContent = status.articles_processed;
-            document.getElementById('articlesAccepted').textContent = status.articles_accepted;
-            
-            const metrics = status.quality_metrics;
-            if (metrics && metrics.avg_quality_score) {
-                document.getElementById('avgQuality').textContent = metrics.avg_quality_score.toFixed(2);
-            }
-        }
-
-        function completeHarvesting(status) {
-            clearInterval(statusInterval);
-            resetInterface();
-            
-            document.getElementById('resultsSection').style.display = 'block';
-            
-            const metrics = status.quality_metrics;
-            document.getElementById('finalCount').textContent = metrics.total_articles;
-            document.getElementById('finalQuality').textContent = metrics.avg_quality_score;
-            document.getElementById('finalBias').textContent = metrics.avg_bias_density + '%';
-            document.getElementById('finalBalance').textContent = 
-                `${metrics.balanced_articles}/${metrics.total_articles} (${metrics.balance_percentage}%)`;
-            document.getElementById('finalWords').textContent = metrics.avg_word_count;
-        }
+# Harvest jobs run one after another on a single long-lived daemon thread, so a
+# running harvest never blocks interpreter exit or Ctrl+C
+harvest_jobs = queue.Queue()
+
+def run_harvest_jobs():
+    """Run queued harvest jobs on the reused background thread"""
+    while True:
+        job, args = harvest_jobs.get()
+        job(*args)  # harvest_news reports its own errors through the status
+
+threading.Thread(target=run_harvest_jobs, name='harvester', daemon=True).start()
+
+# Mojibake left by UTF-8 text decoded as Windows-1252; longer sequences before their prefixes
+ENCODING_FIXES = {
+    'â€™': "'",  # Right single quotation mark
+    'â€œ': '"',  # Left double quotation mark
+    'â€”': '—',  # Em dash
+    'â€“': '–',  # En dash
+    'â€¦': '...',# Horizontal ellipsis
+    'â€²': "'",  # Prime symbol
+    'â€³': '"',  # Double prime
+    'â€š': ',',  # Single low-9 quotation mark
+    'â€ž': '"',  # Double low-9 quotation mark
+    'â€¹': '<',  # Single left angle quotation mark
+    'â€º': '>',  # Single right angle quotation mark
+    'â€': '"',   # Right double quotation mark
+    'â„¢': '™',  # Trademark
+    'â‚¬': '€',  # Euro sign
+}
 
-        function resetInterface() {
-            harvestingActive = false;
-            document.getElementById('harvestBtn').disabled = false;
-            document.getElementById('harvestBtn').textContent = '🚀 Start Harvesting';
-        }
+# Single characters removed in one translate pass: the 'Â' left before non-breaking
+# spaces and symbols such as ®, © and £, plus non-whitespace control characters
+CLEAN_TRANSLATION = dict.fromkeys(
+    [ord('Â'), 0x7f] + [code for code in range(0x20) if not chr(code).isspace()]
+)
 
-        function downloadDataset(format) {
-            window.location.href = `/api/download/${format}`;
-            
-            // Visual feedback
-            const btn = event.target;
-            const originalText = btn.textContent;
-            btn.textContent = '✅ Downloaded!';
-            btn.style.background = '#27ae60';
-            setTimeout(() => {
-                btn.textContent = originalText;
-                btn.style.background = '';
-            }, 2000);
-        }
-    </script>
-</body>
-</html>
-"""
+def clean_text(text):
+    """Clean text and fix encoding issues"""
+    if not text:
+        return text
+    
+    if 'â' in text:  # Every multi-character fix starts with it
+        for bad_char, good_char in ENCODING_FIXES.items():
+            text = text.replace(bad_char, good_char)
+    text = text.translate(CLEAN_TRANSLATION)
+    
+    # Remove any remaining problematic characters, then collapse whitespace
+    text = text.encode('utf-8', errors='ignore').decode('utf-8')
+    return ' '.join(text.split())
+
+# Formats served by /api/download/<format>
+DOWNLOAD_FORMATS = ('json', 'csv', 'report')
+
+# Column order of CSV downloads
+CSV_FIELDS = (
+    'title', 'content', 'url', 'source', 'author', 'publish_date', 'word_count',
+    'quality_score', 'bias_density', 'is_balanced', 'bias_concerns', 'scraped_at'
+)
+
+# Shared read-only stand-in for articles without a bias analysis
+EMPTY_BIAS_ANALYSIS = {}
+
+# Report grades: ascending thresholds and one more label than thresholds
+QUALITY_GRADES = ((0.6, 0.8), ('Fair', 'Good', 'Excellent'))
+DEPTH_GRADES = ((200, 400), ('Standard', 'Substantial', 'Comprehensive'))
+BIAS_GRADES = ((1.5, 3.0), ('Low bias', 'Moderate bias', 'High bias'))
+BALANCE_GRADES = ((60, 80), ('Needs Improvement', 'Good', 'Excellent'))
+
+def grade(value, grades):
+    """Label for a value from a (thresholds, labels) grade table"""
+    thresholds, labels = grades
+    return labels[bisect.bisect(thresholds, value)]
+
+def json_response(payload):
+    """JSON response, serialized with orjson when it is installed"""
+    if orjson is not None:
+        return Response(orjson.dumps(payload, default=str), mimetype='application/json')
+    return jsonify(payload)
+
+# The page has no template variables, so it is rendered and compressed once at startup
+with app.app_context():
+    INDEX_HTML = render_template('index.html').encode('utf-8')
+INDEX_HTML_GZIP = gzip.compress(INDEX_HTML, compresslevel=9)
 
 # Flask Routes
 @app.route('/')
 def index():
     """Serve the main web interface"""
-    return render_template_string(HTML_TEMPLATE)
+    headers = {'Cache-Control': 'public, max-age=300', 'Vary': 'Accept-Encoding'}
+    if request.accept_encodings['gzip']:  # Quality 0 when absent or refused
+        headers['Content-Encoding'] = 'gzip'
+        return Response(INDEX_HTML_GZIP, mimetype='text/html', headers=headers)
+    return Response(INDEX_HTML, mimetype='text/html', headers=headers)
 
 @app.route('/api/harvest', methods=['POST'])
 def start_harvest():
     """Start the news harvesting process"""
     global harvesting_status
     
-    if harvesting_status['active']:
+    if harvesting_status.active:
         return jsonify({'error': 'Harvesting already in progress'}), 400
     
     data = request.json
@@ -924,91 +708,147 @@ def start_harvest():
         return jsonify({'error': 'URL is required'}), 400
     
     # Reset harvesting status
-    harvesting_status.update({
-        'active': True, 'progress': 0, 'articles_found': 0,
-        'articles_processed': 0, 'articles_accepted': 0,
-        'current_status': 'Starting...', 'collected_data': [], 'quality_metrics': {}
-    })
+    harvesting_status.update(
+        active=True, progress=0, articles_found=0,
+        articles_processed=0, articles_accepted=0,
+        current_status='Starting...', collected_data=[], quality_metrics={}, dataset_etag=''
+    )
     
-    # Start harvesting in background thread
-    thread = threading.Thread(target=harvester.harvest_news, args=(url, max_articles, quality_threshold))
-    thread.daemon = True
-    thread.start()
+    # Start harvesting in the background
+    harvest_jobs.put((harvester.harvest_news, (url, max_articles, quality_threshold)))
     
     return jsonify({'message': 'Harvesting started successfully'})
 
 @app.route('/api/status')
 def get_status():
     """Get current harvesting status"""
-    return jsonify(harvesting_status)
+    return json_response(harvesting_status.to_dict())
+
+@app.route('/api/results')
+def get_results():
+    """Get the articles collected by the last harvest"""
+    return json_response(harvesting_status.collected_data)
+
+@app.route('/api/status/stream')
+def stream_status():
+    """Stream harvesting status updates as Server-Sent Events"""
+    listener = harvesting_status.subscribe()
+    
+    def generate():
+        try:
+            snapshot = harvesting_status.to_dict()
+            while True:
+                yield f"data: {json.dumps(snapshot, default=str)}\n\n"
+                if not snapshot['active']:
+                    break
+                try:
+                    snapshot = listener.get(timeout=15)
+                except queue.Empty:
+                    snapshot = harvesting_status.to_dict()  # Heartbeat with the latest state
+        finally:
+            harvesting_status.unsubscribe(listener)
+    
+    return Response(generate(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
 
 @app.route('/api/download/<format>')
 def download_dataset(format):
     """Download dataset in specified format"""
     global harvesting_status
     
-    if not harvesting_status['collected_data']:
+    if not harvesting_status.collected_data:
         return jsonify({'error': 'No data available for download'}), 400
     
-    articles = harvesting_status['collected_data']
+    if format not in DOWNLOAD_FORMATS:
+        return jsonify({'error': 'Invalid format requested'}), 400
+    
+    articles = harvesting_status.collected_data
+    etag = harvesting_status.dataset_etag
+    # The report embeds its generation time, so it only matches the dataset weakly
+    weak_etag = format == 'report'
+    
+    # Repeat downloads of an unchanged dataset are answered before building the file
+    if etag and request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=weak_etag)
+        return response
+    
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
     if format == 'json':
         # Create JSON file
-        json_data = json.dumps(articles, indent=2, default=str)
-        return send_file(
-            io.BytesIO(json_data.encode()),
+        if orjson is not None:
+            json_bytes = orjson.dumps(articles, option=orjson.OPT_INDENT_2, default=str)
+        else:
+            json_bytes = json.dumps(articles, indent=2, default=str).encode()
+        response = send_file(
+            io.BytesIO(json_bytes),
             mimetype='application/json',
             as_attachment=True,
             download_name=f'newsharvest_dataset_{timestamp}.json'
         )
     
     elif format == 'csv':
-        # Create CSV file with encoding fixes
-        output = io.StringIO()
-        if articles:
-            flattened_articles = []
-            for article in articles:
-                flat_article = {
-                    'title': self.clean_text(article.get('title', '')),
-                    'content': self.clean_text(article.get('content', '')),
-                    'url': article.get('url', ''),
-                    'source': article.get('source', ''),
-                    'author': self.clean_text(article.get('author', '')),
-                    'publish_date': article.get('publish_date', ''),
-                    'word_count': article.get('word_count', 0),
-                    'quality_score': article.get('quality_score', 0),
-                    'bias_density': article.get('bias_analysis', {}).get('bias_density', 0),
-                    'is_balanced': article.get('bias_analysis', {}).get('is_balanced', True),
-                    'bias_concerns': '; '.join(article.get('bias_analysis', {}).get('concerns', [])),
-                    'scraped_at': article.get('scraped_at', '')
-                }
-                flattened_articles.append(flat_article)
+        # Stream the CSV row by row with encoding fixes
+        def generate():
+            clean = clean_text
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
             
-            writer = csv.DictWriter(output, fieldnames=flattened_articles[0].keys())
-            writer.writeheader()
-            writer.writerows(flattened_articles)
-        
-        return send_file(
-            io.BytesIO(output.getvalue().encode('utf-8')),
+            def drain():
+                # Hand over what was just written and reuse the buffer for the next row
+                chunk = buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+                return chunk
+            
+            writer.writerow(CSV_FIELDS)
+            yield drain()
+            for article in articles:
+                bias = article.get('bias_analysis') or EMPTY_BIAS_ANALYSIS
+                concerns = bias.get('concerns')
+                # Values in CSV_FIELDS order
+                writer.writerow((
+                    clean(article.get('title', '')),
+                    clean(article.get('content', '')),
+                    article.get('url', ''),
+                    article.get('source', ''),
+                    clean(article.get('author', '')),
+                    article.get('publish_date', ''),
+                    article.get('word_count', 0),
+                    article.get('quality_score', 0),
+                    bias.get('bias_density', 0),
+                    bias.get('is_balanced', True),
+                    '; '.join(concerns) if concerns else '',
+                    article.get('scraped_at', '')
+                ))
+                yield drain()
+        
+        response = Response(
+            stream_with_context(generate()),
             mimetype='text/csv',
-            as_attachment=True,
-            download_name=f'newsharvest_dataset_{timestamp}.csv'
+            headers={'Content-Disposition': f'attachment; filename=newsharvest_dataset_{timestamp}.csv'}
         )
     
-    elif format == 'report':
+    else:
         # Create comprehensive quality report
-        metrics = harvesting_status.get('quality_metrics', {})
+        metrics = harvesting_status.quality_metrics
         
-        # Analyze sources
-        sources = [a.get('source', 'Unknown') for a in articles]
-        source_counts = Counter(sources)
+        # Analyze sources and, where available, categories in one pass
+        source_counts, category_counts = Counter(), Counter()
+        for a in articles:
+            source_counts[a.get('source', 'Unknown')] += 1
+            category = a.get('category')
+            if category:
+                category_counts[category] += 1
+        if not category_counts:
+            category_counts = {'General': len(articles)}
         
-        # Analyze categories if available
-        categories = [a.get('category', 'General') for a in articles if a.get('category')]
-        category_counts = Counter(categories) if categories else {'General': len(articles)}
+        avg_quality = metrics.get('avg_quality_score', 0)
+        avg_words = metrics.get('avg_word_count', 0)
+        avg_bias = metrics.get('avg_bias_density', 0)
+        balance_percentage = metrics.get('balance_percentage', 0)
         
-        report = f"""# NewsHarvest Pro - Comprehensive Quality Report
+        parts = [f"""# NewsHarvest Pro - Comprehensive Quality Report
 
 ## Collection Summary
 - **Collection Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -1017,25 +857,27 @@ def download_dataset(format):
 - **Framework Version**: NewsHarvest Pro v1.0
 
 ## Quality Metrics
-- **Average Quality Score**: {metrics.get('avg_quality_score', 0):.3f} / 1.0
-- **Quality Grade**: {"Excellent" if metrics.get('avg_quality_score', 0) >= 0.8 else "Good" if metrics.get('avg_quality_score', 0) >= 0.6 else "Fair"}
-- **Average Word Count**: {metrics.get('avg_word_count', 0):,} words
-- **Content Depth**: {"Comprehensive" if metrics.get('avg_word_count', 0) >= 400 else "Substantial" if metrics.get('avg_word_count', 0) >= 200 else "Standard"}
+- **Average Quality Score**: {avg_quality:.3f} / 1.0
+- **Quality Grade**: {grade(avg_quality, QUALITY_GRADES)}
+- **Average Word Count**: {avg_words:,} words
+- **Content Depth**: {grade(avg_words, DEPTH_GRADES)}
 
 ## Bias Analysis
-- **Average Bias Density**: {metrics.get('avg_bias_density', 0):.2f}%
-- **Bias Assessment**: {"Low bias" if metrics.get('avg_bias_density', 0) < 1.5 else "Moderate bias" if metrics.get('avg_bias_density', 0) < 3.0 else "High bias"}
-- **Balanced Articles**: {metrics.get('balanced_articles', 0)} / {metrics.get('total_articles', 0)} ({metrics.get('balance_percentage', 0):.1f}%)
-- **Balance Grade**: {"Excellent" if metrics.get('balance_percentage', 0) >= 80 else "Good" if metrics.get('balance_percentage', 0) >= 60 else "Needs Improvement"}
+- **Average Bias Density**: {avg_bias:.2f}%
+- **Bias Assessment**: {grade(avg_bias, BIAS_GRADES)}
+- **Balanced Articles**: {metrics.get('balanced_articles', 0)} / {metrics.get('total_articles', 0)} ({balance_percentage:.1f}%)
+- **Balance Grade**: {grade(balance_percentage, BALANCE_GRADES)}
 
 ## Source Distribution
-"""
+"""]
         
-        for source, count in source_counts.most_common():
-            percentage = (count / len(articles)) * 100
-            report += f"- **{source}**: {count} articles ({percentage:.1f}%)\n"
+        percent_per_article = 100.0 / len(articles)
+        parts.extend(
+            f"- **{source}**: {count} articles ({count * percent_per_article:.1f}%)\n"
+            for source, count in source_counts.most_common()
+        )
         
-        report += f"""
+        parts.append(f"""
 ## Technical Specifications
 - **Collection Method**: Intelligent URL discovery with pattern recognition
 - **Quality Control**: Multi-stage validation pipeline
@@ -1078,17 +920,20 @@ def download_dataset(format):
 **Report Generated by NewsHarvest Pro**  
 *Professional News Data Collection Framework*  
 *For questions about this dataset, refer to the framework documentation*
-"""
+""")
+        report = ''.join(parts)
         
-        return send_file(
+        response = send_file(
             io.BytesIO(report.encode()),
             mimetype='text/markdown',
             as_attachment=True,
             download_name=f'newsharvest_quality_report_{timestamp}.md'
         )
     
-    else:
-        return jsonify({'error': 'Invalid format requested'}), 400
+    # Werkzeug handles the remaining conditional headers, such as If-Modified-Since
+    if etag:
+        response.set_etag(etag, weak=weak_etag)
+    return response.make_conditional(request)
 
 if __name__ == '__main__':
     print("🚀 NewsHarvest Pro - Flask Web Version")
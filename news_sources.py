@@ -0,0 +1,24 @@
+# NewsHarvest Pro - Source names shared by the web app and the command line version
+
+# Display names for well-known news domains
+SOURCE_MAP = {
+    'bbc.com': 'BBC',
+    'bbc.co.uk': 'BBC',
+    'bbci.co.uk': 'BBC',
+    'reuters.com': 'Reuters',
+    'theguardian.com': 'Guardian',
+    'guardian.co.uk': 'Guardian',
+    'techcrunch.com': 'TechCrunch',
+    'cnn.com': 'CNN',
+    'npr.org': 'NPR'
+}
+
+def lookup_source(host):
+    """Display name for a host or its nearest listed parent domain, else None"""
+    labels = host.lower().split('.')
+    # e.g. feeds.bbci.co.uk tries itself, then bbci.co.uk, co.uk
+    for i in range(len(labels) - 1):
+        name = SOURCE_MAP.get('.'.join(labels[i:]))
+        if name:
+            return name
+    return None
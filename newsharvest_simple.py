@@ -2,25 +2,67 @@
 # No Flask required - just run and get results!
 
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 import json
+import csv
 import time
 import random
 import hashlib
 import re
+import string
+import sqlite3
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from news_sources import lookup_source
+
+try:
+    import ahocorasick  # Optional: single-pass bias keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # Optional: faster JSON serialization
+except ImportError:
+    orjson = None
 
 class SimpleNewsHarvester:
     """Simple but powerful news harvester for command line use"""
     
-    def __init__(self):
+    def __init__(self, seen_db=None):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
+        # Number of article pages fetched concurrently
+        self.max_workers = 4
+        
+        # Articles the last harvest_news call skipped as collected in earlier runs
+        self.skipped_seen = 0
+        
+        # Optional SQLite file remembering accepted article URLs across runs.
+        # Only harvest_news touches it, after worker threads have finished, so the
+        # harvester may be created in one thread and used from another.
+        self._seen_db = None
+        if seen_db:
+            self._seen_db = sqlite3.connect(seen_db, check_same_thread=False)
+            self._seen_db.execute('PRAGMA journal_mode=WAL')
+            self._seen_db.execute('CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY, content_hash TEXT, seen_at REAL)')
+        
+        # Persistent session so repeated fetches from one site reuse connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Bias detection keywords
         self.bias_keywords = {
             'political_left': ['progressive', 'liberal', 'democrat', 'climate change', 'social justice'],
@@ -31,6 +73,93 @@ class SimpleNewsHarvester:
             'economic_bias': ['wealthy', 'poor', 'working class', 'elite']
         }
         
+        # Aho-Corasick automaton over all bias keywords, when pyahocorasick is installed
+        self._bias_automaton = None
+        if ahocorasick is not None:
+            self._bias_automaton = ahocorasick.Automaton()
+            for category, keywords in self.bias_keywords.items():
+                for keyword in keywords:
+                    self._bias_automaton.add_word(keyword, category)
+            self._bias_automaton.make_automaton()
+        
+        # Extraction selectors, each list in priority order and compiled once instead of per article
+        self._title_selectors = [sv.compile(s) for s in [
+            'h1[data-testid="headline"]',  # BBC specific
+            'h1.story-headline',           # Common news pattern
+            'h1.article-title',            # Alternative pattern
+            'h1',                          # Generic fallback
+            '.headline h1',                # Nested headline
+            '.article-header h1'           # Article header
+        ]]
+        self._content_selectors = [sv.compile(s) for s in [
+            '[data-component="text-block"] p',  # BBC specific
+            'article p',                        # Semantic HTML
+            '.story-body p',                    # Common news class
+            '.article-content p',               # Alternative
+            '.post-content p',                  # Blog style
+            '.content p'                        # Generic content
+        ]]
+        self._paragraph_selector = sv.compile('p')  # Fallback when no content selector matches
+        self._author_selectors = [sv.compile(s) for s in [
+            '.byline', '.author', '[data-component="byline"]',
+            '.article-author', '[rel="author"]', '.writer',
+            '.journalist', '.correspondent'
+        ]]
+        self._date_selectors = [sv.compile(s) for s in [
+            'time[datetime]', '[data-testid="timestamp"]',
+            '.date', '.published', '.article-date',
+            '.publish-date', '.timestamp'
+        ]]
+        
+        # Union of the title/author/date selectors, walked once per article
+        self._metadata_selectors = self._title_selectors + self._author_selectors + self._date_selectors
+        self._metadata_union = sv.compile(', '.join(sel.pattern for sel in self._metadata_selectors))
+        
+        # Common encoding fixes
+        encoding_fixes = {
+            'â€™': "'",  # Right single quotation mark
+            'â€œ': '"',  # Left double quotation mark  
+            'â€': '"',   # Right double quotation mark
+            'â€”': '—',  # Em dash
+            'â€“': '–',  # En dash
+            'â€¦': '...',# Horizontal ellipsis
+            'â€²': "'",  # Prime symbol
+            'â€³': '"',  # Double prime
+            'â„¢': '™',  # Trademark
+            'â‚¬': '€',  # Euro sign
+            'â€š': ',',  # Single low-9 quotation mark
+            'â€ž': '"',  # Double low-9 quotation mark
+            'â€¹': '<',  # Single left angle quotation mark
+            'â€º': '>',  # Single right angle quotation mark
+        }
+        # Longest first, so no sequence is pre-empted by a shorter one it starts with
+        self.encoding_fixes = sorted(encoding_fixes.items(), key=lambda fix: len(fix[0]), reverse=True)
+        
+        # Single characters removed in one translate pass: the 'Â' left before non-breaking
+        # spaces and symbols such as ®, © and £, plus non-whitespace control characters
+        self._clean_table = dict.fromkeys(
+            [ord('Â'), 0x7f] + [code for code in range(0x20) if not chr(code).isspace()]
+        )
+        
+        # Deletes ASCII capitals; the length difference gives the caps count
+        self._uppercase_table = str.maketrans('', '', string.ascii_uppercase)
+        
+        # Patterns that typically indicate news articles, compiled once instead of per link
+        article_patterns = [
+            r'/news/', r'/article/', r'/\d{4}/\d{2}/', r'/world/', 
+            r'/politics/', r'/technology/', r'/business/', r'/health/',
+            r'/science/', r'/environment/', r'/sports/'
+        ]
+        
+        # Patterns to exclude (not articles)
+        exclude_patterns = [
+            r'/live/', r'/weather/', r'/search', r'#', r'javascript:',
+            r'/video/', r'/gallery/', r'/podcast/', r'/newsletter/',
+            r'/subscribe/', r'/contact/', r'/about/'
+        ]
+        self._article_re = re.compile('|'.join(article_patterns))
+        self._exclude_re = re.compile('|'.join(exclude_patterns))
+        
         print("🗞️ NewsHarvest Pro - Simple Version Initialized")
         print("✅ Ready for professional news data collection")
     
@@ -38,7 +167,7 @@ class SimpleNewsHarvester:
         """Fetch webpage with error handling"""
         try:
             time.sleep(random.uniform(1, 2))  # Be respectful to servers
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             if response.status_code == 200:
                 return response.text
             else:
@@ -48,6 +177,20 @@ class SimpleNewsHarvester:
             print(f"❌ Error fetching {url}: {e}")
             return None
     
+    def close(self):
+        """Release pooled connections and the seen-URL database"""
+        self.session.close()
+        if self._seen_db is not None:
+            self._seen_db.close()
+    
+    def _seen_urls(self, urls):
+        """Subset of urls already accepted in an earlier run"""
+        if self._seen_db is None or not urls:
+            return set()
+        placeholders = ', '.join('?' * len(urls))
+        rows = self._seen_db.execute(f'SELECT url FROM seen WHERE url IN ({placeholders})', urls)
+        return {url for (url,) in rows}
+    
     def find_article_urls(self, homepage_url):
         """Discover article URLs from news homepage"""
         print(f"🔍 Discovering articles on {homepage_url}")
@@ -56,20 +199,25 @@ class SimpleNewsHarvester:
         if not html_content:
             return []
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Only build the anchors that carry links; the rest of the page is skipped
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=SoupStrainer('a', href=True))
         all_links = soup.find_all('a', href=True)
         
-        article_urls = []
+        unique_urls = []
+        seen = set()
         base_domain = urlparse(homepage_url).netloc
         
         for link in all_links:
             href = link['href']
             absolute_url = urljoin(homepage_url, href)
             
-            if self.is_article_url(absolute_url, base_domain):
-                article_urls.append(absolute_url)
+            # Keep the first occurrence in page order, limited for performance
+            if absolute_url not in seen and self.is_article_url(absolute_url, base_domain):
+                seen.add(absolute_url)
+                unique_urls.append(absolute_url)
+                if len(unique_urls) >= 40:
+                    break
         
-        unique_urls = list(set(article_urls))[:40]  # Remove duplicates, limit for performance
         print(f"📊 Found {len(unique_urls)} potential article URLs")
         return unique_urls
     
@@ -78,29 +226,8 @@ class SimpleNewsHarvester:
         if base_domain not in url:
             return False
         
-        # Patterns that typically indicate news articles
-        article_patterns = [
-            r'/news/', r'/article/', r'/\d{4}/\d{2}/', r'/world/', 
-            r'/politics/', r'/technology/', r'/business/', r'/health/',
-            r'/science/', r'/environment/', r'/sports/'
-        ]
-        
-        # Patterns to exclude (not articles)
-        exclude_patterns = [
-            r'/live/', r'/weather/', r'/search', r'#', r'javascript:',
-            r'/video/', r'/gallery/', r'/podcast/', r'/newsletter/',
-            r'/subscribe/', r'/contact/', r'/about/'
-        ]
-        
-        # Check if URL matches article patterns
-        for pattern in article_patterns:
-            if re.search(pattern, url):
-                # Ensure it doesn't match exclude patterns
-                for exclude in exclude_patterns:
-                    if re.search(exclude, url):
-                        return False
-                return True
-        return False
+        # Must match an article pattern and none of the exclude patterns
+        return self._article_re.search(url) is not None and self._exclude_re.search(url) is None
     
     def scrape_article(self, url):
         """Extract article content and metadata"""
@@ -108,60 +235,39 @@ class SimpleNewsHarvester:
         if not html_content:
             return None
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
+        
+        # One walk of the tree finds the title, author and date candidates
+        first_matches = self._first_matches(soup)
         
         # Extract title using multiple strategies
         title = None
-        title_selectors = [
-            'h1[data-testid="headline"]',  # BBC specific
-            'h1.story-headline',           # Common news pattern
-            'h1.article-title',            # Alternative pattern
-            'h1',                          # Generic fallback
-            '.headline h1',                # Nested headline
-            '.article-header h1'           # Article header
-        ]
-        
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text(strip=True):
-                title = element.get_text(strip=True)
+        for selector in self._title_selectors:
+            element = first_matches.get(selector.pattern)
+            if element and (text := element.get_text(strip=True)):
+                title = text
                 break
         
         # Extract content using multiple strategies
         content_paragraphs = []
-        content_selectors = [
-            '[data-component="text-block"] p',  # BBC specific
-            'article p',                        # Semantic HTML
-            '.story-body p',                    # Common news class
-            '.article-content p',               # Alternative
-            '.post-content p',                  # Blog style
-            '.content p'                        # Generic content
-        ]
-        
-        for selector in content_selectors:
-            paragraphs = soup.select(selector)
+        for selector in self._content_selectors:
+            paragraphs = selector.select(soup)
             if paragraphs and len(paragraphs) >= 3:  # Need substantial content
-                content_paragraphs = [p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)]
+                content_paragraphs = [text for p in paragraphs if (text := p.get_text(strip=True))]
                 break
         
         # If no specific content found, try all paragraphs as fallback
         if not content_paragraphs:
-            all_paragraphs = soup.select('p')
+            all_paragraphs = self._paragraph_selector.select(soup)
             if len(all_paragraphs) >= 5:
-                content_paragraphs = [p.get_text(strip=True) for p in all_paragraphs if p.get_text(strip=True)]
+                content_paragraphs = [text for p in all_paragraphs if (text := p.get_text(strip=True))]
         
-        content = ' '.join(content_paragraphs)
+        content = self.clean_text(' '.join(content_paragraphs))
         
         # Extract author information
         author = None
-        author_selectors = [
-            '.byline', '.author', '[data-component="byline"]',
-            '.article-author', '[rel="author"]', '.writer',
-            '.journalist', '.correspondent'
-        ]
-        
-        for selector in author_selectors:
-            element = soup.select_one(selector)
+        for selector in self._author_selectors:
+            element = first_matches.get(selector.pattern)
             if element:
                 author_text = element.get_text(strip=True)
                 if author_text and len(author_text) < 100:  # Reasonable author name length
@@ -170,30 +276,35 @@ class SimpleNewsHarvester:
         
         # Extract publish date
         publish_date = None
-        date_selectors = [
-            'time[datetime]', '[data-testid="timestamp"]',
-            '.date', '.published', '.article-date',
-            '.publish-date', '.timestamp'
-        ]
-        
-        for selector in date_selectors:
-            element = soup.select_one(selector)
+        for selector in self._date_selectors:
+            element = first_matches.get(selector.pattern)
             if element:
                 date_value = element.get('datetime') or element.get_text(strip=True)
                 if date_value:
                     publish_date = date_value
                     break
         
+        # Text fields are cleaned here, so quality scoring, bias analysis and the
+        # duplicate hash all see the fixed text rather than raw mojibake
         return {
-            'title': title,
+            'title': self.clean_text(title),
             'content': content,
             'url': url,
-            'author': author,
-            'publish_date': publish_date,
+            'author': self.clean_text(author),
+            'publish_date': self.clean_text(publish_date),
             'scraped_at': datetime.now().isoformat(),
             'word_count': len(content.split()) if content else 0
         }
     
+    def _first_matches(self, soup):
+        """Map each title/author/date selector to its first matching element"""
+        first = {}
+        for element in self._metadata_union.iselect(soup):
+            for selector in self._metadata_selectors:
+                if selector.pattern not in first and selector.match(element):
+                    first[selector.pattern] = element
+        return first
+    
     def calculate_quality_score(self, article):
         """Calculate comprehensive quality score (0-1)"""
         score = 0.0
@@ -233,7 +344,9 @@ class SimpleNewsHarvester:
         # Language quality assessment (0-0.10)
         if content:
             # Check caps ratio (too many caps = poor quality)
-            caps_ratio = sum(1 for c in content if c.isupper()) / len(content) if content else 0
+            content_length = len(content)
+            caps_count = content_length - len(content.translate(self._uppercase_table))
+            caps_ratio = caps_count / content_length
             if caps_ratio <= 0.05:  # Less than 5% caps
                 score += 0.10
             elif caps_ratio <= 0.10:  # Less than 10% caps
@@ -247,10 +360,12 @@ class SimpleNewsHarvester:
         
         return min(score, 1.0)  # Cap at 1.0
     
-    def analyze_bias(self, text):
-        """Perform comprehensive bias analysis"""
-        text_lower = text.lower()
-        word_count = len(text.split())
+    def analyze_bias(self, *texts, word_count=None):
+        """Perform comprehensive bias analysis over one or more texts"""
+        # Each text is scanned on its own so title and body are never concatenated
+        texts_lower = [text.lower() for text in texts]
+        if word_count is None:  # Callers that already counted words skip the split
+            word_count = sum(len(text.split()) for text in texts)
         
         if word_count == 0:
             return {
@@ -260,14 +375,19 @@ class SimpleNewsHarvester:
                 'concerns': []
             }
         
-        bias_scores = {}
-        total_bias_indicators = 0
-        
         # Count bias indicators by category
-        for category, keywords in self.bias_keywords.items():
-            count = sum(text_lower.count(keyword) for keyword in keywords)
-            bias_scores[category] = count
-            total_bias_indicators += count
+        if self._bias_automaton is not None:
+            # One scan of the text finds every keyword occurrence
+            bias_scores = dict.fromkeys(self.bias_keywords, 0)
+            for text_lower in texts_lower:
+                for _, category in self._bias_automaton.iter(text_lower):
+                    bias_scores[category] += 1
+        else:
+            bias_scores = {
+                category: sum(text_lower.count(keyword) for text_lower in texts_lower for keyword in keywords)
+                for category, keywords in self.bias_keywords.items()
+            }
+        total_bias_indicators = sum(bias_scores.values())
         
         # Calculate bias density as percentage
         bias_density = (total_bias_indicators / word_count * 100)
@@ -312,6 +432,8 @@ class SimpleNewsHarvester:
         print(f"🎚️  Target: {max_articles} articles (Quality ≥ {quality_threshold})")
         print("=" * 60)
         
+        self.skipped_seen = 0
+        
         # Step 1: Discover article URLs
         article_urls = self.find_article_urls(homepage_url)
         
@@ -319,6 +441,16 @@ class SimpleNewsHarvester:
             print("❌ No article URLs found. Try a different news website.")
             return []
         
+        # Skip articles accepted in earlier runs before spending requests on them
+        seen_urls = self._seen_urls(article_urls)
+        if seen_urls:
+            self.skipped_seen = len(seen_urls)
+            print(f"⏭️  Skipping {len(seen_urls)} articles collected in earlier runs")
+            article_urls = [url for url in article_urls if url not in seen_urls]
+            if not article_urls:
+                print("✅ No new articles since the last run.")
+                return []
+        
         # Step 2: Process articles
         print(f"\n📰 Processing up to {min(len(article_urls), max_articles * 2)} articles...")
         
@@ -327,74 +459,87 @@ class SimpleNewsHarvester:
         seen_hashes = set()
         
         # Determine source name from URL
-        domain = urlparse(homepage_url).netloc.lower()
-        if 'bbc' in domain:
-            source_name = 'BBC'
-        elif 'reuters' in domain:
-            source_name = 'Reuters'
-        elif 'guardian' in domain:
-            source_name = 'Guardian'
-        elif 'techcrunch' in domain:
-            source_name = 'TechCrunch'
-        elif 'cnn' in domain:
-            source_name = 'CNN'
-        elif 'npr' in domain:
-            source_name = 'NPR'
-        else:
-            source_name = domain.replace('www.', '').replace('.com', '').title()
-        
-        for i, article_url in enumerate(article_urls[:max_articles * 2], 1):
-            processed += 1
-            print(f"🔄 Processing {processed}: {article_url[:60]}...")
-            
-            # Scrape article
-            article = self.scrape_article(article_url)
-            if not article:
-                print("   ❌ Failed to extract content")
-                continue
-            
-            # Add source information
-            article['source'] = source_name
-            
-            # Basic validation
-            if not article['title'] or len(article['title']) < 10:
-                print("   ❌ Title too short or missing")
-                continue
-            
-            if article['word_count'] < 100:
-                print(f"   ❌ Content too short ({article['word_count']} words)")
-                continue
-            
-            # Calculate quality score
-            quality_score = self.calculate_quality_score(article)
-            article['quality_score'] = quality_score
-            
-            if quality_score < quality_threshold:
-                print(f"   ❌ Quality too low ({quality_score:.2f})")
-                continue
-            
-            # Perform bias analysis
-            combined_text = f"{article['title']} {article['content']}"
-            bias_analysis = self.analyze_bias(combined_text)
-            article['bias_analysis'] = bias_analysis
-            
-            # Check for duplicates
-            content_hash = hashlib.md5(f"{article['title']}{article['content'][:500]}".encode()).hexdigest()
-            if content_hash in seen_hashes:
-                print("   ❌ Duplicate content")
-                continue
-            
-            seen_hashes.add(content_hash)
-            article['content_hash'] = content_hash
-            
-            # Article passed all checks
-            collected_articles.append(article)
-            print(f"   ✅ ACCEPTED - Quality: {quality_score:.2f}, Bias: {bias_analysis['bias_density']:.1f}%, Words: {article['word_count']}")
-            
-            # Stop if we have enough articles
-            if len(collected_articles) >= max_articles:
-                print(f"\n🎯 Target reached: {max_articles} articles collected")
-                break
+        domain = urlparse(homepage_url).hostname or ''
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        source_name = lookup_source(domain) or domain.replace('.com', '').title()
+        
+        # Fetch candidate articles concurrently and process them as they arrive
+        candidate_urls = article_urls[:max_articles * 2]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.scrape_article, candidate): candidate for candidate in candidate_urls}
+            try:
+                for future in as_completed(futures):
+                    article_url = futures[future]
+                    article = future.result()
+                
+                    processed += 1
+                    print(f"🔄 Processing {processed}: {article_url[:60]}...")
+                
+                    if not article:
+                        print("   ❌ Failed to extract content")
+                        continue
+                
+                    # Add source information
+                    article['source'] = source_name
+                
+                    # Basic validation
+                    if not article['title'] or len(article['title']) < 10:
+                        print("   ❌ Title too short or missing")
+                        continue
+                
+                    if article['word_count'] < 100:
+                        print(f"   ❌ Content too short ({article['word_count']} words)")
+                        continue
+                
+                    # Calculate quality score
+                    quality_score = self.calculate_quality_score(article)
+                    article['quality_score'] = quality_score
+                
+                    if quality_score < quality_threshold:
+                        print(f"   ❌ Quality too low ({quality_score:.2f})")
+                        continue
+                
+                    # Perform bias analysis
+                    combined_words = article['word_count'] + len(article['title'].split())
+                    bias_analysis = self.analyze_bias(article['title'], article['content'], word_count=combined_words)
+                    article['bias_analysis'] = bias_analysis
+                
+                    # Check for duplicates
+                    content_hash = hashlib.blake2b(
+                        f"{article['title']}{article['content'][:500]}".encode('utf-8', 'ignore'), digest_size=16
+                    ).hexdigest()
+                    if content_hash in seen_hashes:
+                        print("   ❌ Duplicate content")
+                        continue
+                
+                    seen_hashes.add(content_hash)
+                    article['content_hash'] = content_hash
+                
+                    # Article passed all checks
+                    collected_articles.append(article)
+                    print(f"   ✅ ACCEPTED - Quality: {quality_score:.2f}, Bias: {bias_analysis['bias_density']:.1f}%, Words: {article['word_count']}")
+                
+                    # Stop if we have enough articles
+                    if len(collected_articles) >= max_articles:
+                        print(f"\n🎯 Target reached: {max_articles} articles collected")
+                        break
+            finally:
+                # Drop fetches that have not started yet when stopping early or interrupted
+                for future in futures:
+                    future.cancel()
+        
+        # Completion order depends on timing; report articles in page order
+        page_order = {url: index for index, url in enumerate(candidate_urls)}
+        collected_articles.sort(key=lambda a: page_order[a['url']])
+        
+        # Remember accepted articles for later runs, in one transaction
+        if self._seen_db is not None and collected_articles:
+            with self._seen_db:
+                self._seen_db.executemany(
+                    'INSERT OR IGNORE INTO seen VALUES (?, ?, ?)',
+                    [(a['url'], a['content_hash'], time.time()) for a in collected_articles]
+                )
         
         print("\n" + "=" * 60)
         print(f"📊 COLLECTION COMPLETE")
@@ -408,21 +553,37 @@ class SimpleNewsHarvester:
         if not articles:
             return "No articles collected."
         
-        # Calculate aggregate metrics
+        # Calculate aggregate metrics, quality and source distribution and bias totals in one pass
         total_articles = len(articles)
-        avg_quality = sum(a['quality_score'] for a in articles) / total_articles
-        avg_bias = sum(a['bias_analysis']['bias_density'] for a in articles) / total_articles
-        avg_words = sum(a['word_count'] for a in articles) / total_articles
-        balanced_articles = sum(1 for a in articles if a['bias_analysis']['is_balanced'])
-        
-        # Source distribution
-        sources = [a['source'] for a in articles]
-        source_counts = Counter(sources)
+        quality_sum = bias_sum = words_sum = 0
+        balanced_articles = excellent_quality = good_quality = fair_quality = 0
+        source_counts = Counter()
+        all_bias_scores = dict.fromkeys(self.bias_keywords, 0)
+        for a in articles:
+            quality = a['quality_score']
+            bias = a['bias_analysis']
+            quality_sum += quality
+            bias_sum += bias['bias_density']
+            words_sum += a['word_count']
+            if bias['is_balanced']:
+                balanced_articles += 1
+            
+            if quality >= 0.8:
+                excellent_quality += 1
+            elif quality >= 0.6:
+                good_quality += 1
+            else:
+                fair_quality += 1
+            
+            source_counts[a['source']] += 1
+            
+            bias_scores = bias['bias_scores']
+            for category in all_bias_scores:
+                all_bias_scores[category] += bias_scores.get(category, 0)
         
-        # Quality distribution
-        excellent_quality = sum(1 for a in articles if a['quality_score'] >= 0.8)
-        good_quality = sum(1 for a in articles if 0.6 <= a['quality_score'] < 0.8)
-        fair_quality = sum(1 for a in articles if a['quality_score'] < 0.6)
+        avg_quality = quality_sum / total_articles
+        avg_bias = bias_sum / total_articles
+        avg_words = words_sum / total_articles
         
         print("\n" + "=" * 60)
         print("📈 DATASET QUALITY ANALYSIS")
@@ -444,11 +605,6 @@ class SimpleNewsHarvester:
             print(f"   • {source}: {count} articles ({percentage:.1f}%)")
         
         # Bias analysis summary
-        all_bias_scores = {}
-        for category in self.bias_keywords.keys():
-            total_score = sum(a['bias_analysis']['bias_scores'].get(category, 0) for a in articles)
-            all_bias_scores[category] = total_score
-        
         if any(score > 0 for score in all_bias_scores.values()):
             print(f"\n⚖️  Bias Category Analysis:")
             for category, score in all_bias_scores.items():
@@ -483,31 +639,11 @@ class SimpleNewsHarvester:
         if not text:
             return text
         
-        # Common encoding fixes
-        encoding_fixes = {
-            'â€™': "'",  # Right single quotation mark
-            'â€œ': '"',  # Left double quotation mark  
-            'â€': '"',   # Right double quotation mark
-            'â€"': '—',  # Em dash
-            'â€"': '–',  # En dash
-            'â€¦': '...',# Horizontal ellipsis
-            'Â': '',     # Non-breaking space artifacts
-            'â€²': "'",  # Prime symbol
-            'â€³': '"',  # Double prime
-            'â„¢': '™',  # Trademark
-            'Â®': '®',   # Registered trademark
-            'Â©': '©',   # Copyright
-            'â‚¬': '€',  # Euro sign
-            'Â£': '£',   # Pound sign
-            'â€š': ',',  # Single low-9 quotation mark
-            'â€ž': '"',  # Double low-9 quotation mark
-            'â€¹': '<',  # Single left angle quotation mark
-            'â€º': '>',  # Single right angle quotation mark
-        }
-        
-        # Apply fixes
-        for bad_char, good_char in encoding_fixes.items():
-            text = text.replace(bad_char, good_char)
+        # Apply fixes, skipped entirely for text without the 'â' every multi-character fix starts with
+        if 'â' in text:
+            for bad_char, good_char in self.encoding_fixes:
+                text = text.replace(bad_char, good_char)
+        text = text.translate(self._clean_table)
         
         # Remove any remaining problematic characters
         text = text.encode('utf-8', errors='ignore').decode('utf-8')
@@ -518,7 +654,7 @@ class SimpleNewsHarvester:
         return text
     
     def save_dataset(self, articles, format='json', filename=None):
-        """Save dataset to file with proper encoding"""
+        """Save dataset to file with proper encoding (text is cleaned by scrape_article)"""
         if not articles:
             print("❌ No articles to save")
             return None
@@ -528,32 +664,13 @@ class SimpleNewsHarvester:
         if format == 'json':
             filename = filename or f'newsharvest_dataset_{timestamp}.json'
             
-            # Clean all text data before saving
-            cleaned_articles = []
-            for article in articles:
-                cleaned_article = {}
-                for key, value in article.items():
-                    if isinstance(value, str):
-                        cleaned_article[key] = self.clean_text(value)
-                    elif isinstance(value, dict):
-                        # Handle nested dictionaries like bias_analysis
-                        cleaned_dict = {}
-                        for subkey, subvalue in value.items():
-                            if isinstance(subvalue, str):
-                                cleaned_dict[subkey] = self.clean_text(subvalue)
-                            elif isinstance(subvalue, list):
-                                # Handle lists of strings
-                                cleaned_dict[subkey] = [self.clean_text(item) if isinstance(item, str) else item for item in subvalue]
-                            else:
-                                cleaned_dict[subkey] = subvalue
-                        cleaned_article[key] = cleaned_dict
-                    else:
-                        cleaned_article[key] = value
-                cleaned_articles.append(cleaned_article)
-            
             # Save with proper UTF-8 encoding
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(cleaned_articles, f, indent=2, ensure_ascii=False, default=str)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2, default=str))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(articles, f, indent=2, ensure_ascii=False, default=str)
             
             print(f"💾 Dataset saved as JSON: {filename}")
             return filename
@@ -565,11 +682,11 @@ class SimpleNewsHarvester:
             flattened_articles = []
             for article in articles:
                 flat_article = {
-                    'title': self.clean_text(article.get('title', '')),
-                    'content': self.clean_text(article.get('content', '')),
+                    'title': article.get('title', ''),
+                    'content': article.get('content', ''),
                     'url': article.get('url', ''),
                     'source': article.get('source', ''),
-                    'author': self.clean_text(article.get('author', '')),
+                    'author': article.get('author', ''),
                     'publish_date': article.get('publish_date', ''),
                     'word_count': article.get('word_count', 0),
                     'quality_score': article.get('quality_score', 0),
@@ -581,8 +698,10 @@ class SimpleNewsHarvester:
                 flattened_articles.append(flat_article)
             
             # Save CSV with proper encoding
-            df = pd.DataFrame(flattened_articles)
-            df.to_csv(filename, index=False, encoding='utf-8')
+            with open(filename, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=list(flattened_articles[0].keys()))
+                writer.writeheader()
+                writer.writerows(flattened_articles)
             
             print(f"💾 Dataset saved as CSV: {filename}")
             return filename
@@ -591,7 +710,7 @@ class SimpleNewsHarvester:
             print(f"❌ Unsupported format: {format}")
             return None
 
-def main():
+def main(seen_db=None):
     """Main function for command line usage"""
     print("🗞️ NewsHarvest Pro - Simple Command Line Version")
     print("=" * 60)
@@ -599,7 +718,9 @@ def main():
     print()
     
     # Initialize harvester
-    harvester = SimpleNewsHarvester()
+    harvester = SimpleNewsHarvester(seen_db=seen_db)
+    if seen_db:
+        print(f"🗂️  Skipping articles already collected (index: {seen_db})")
     
     # Interactive mode
     while True:
@@ -658,6 +779,9 @@ def main():
                 
                 print(f"\n✅ Collection complete! {len(articles)} articles processed.")
                 
+            elif harvester.skipped_seen:
+                print(f"\n✅ No new articles: {harvester.skipped_seen} were already collected in earlier runs.")
+            
             else:
                 print("\n❌ No articles collected. Try a different website or lower quality threshold.")
             
@@ -674,15 +798,17 @@ def main():
         except Exception as e:
             print(f"\n❌ Unexpected error: {e}")
             print("🔄 Please try again with a different URL")
+    
+    harvester.close()
 
 # Example usage function
-def example_usage():
+def example_usage(seen_db=None):
     """Show example of how to use the harvester programmatically"""
     print("📖 Example Usage:")
     print("-" * 40)
     
     # Initialize
-    harvester = SimpleNewsHarvester()
+    harvester = SimpleNewsHarvester(seen_db=seen_db)
     
     # Collect articles
     articles = harvester.harvest_news("https://www.bbc.com/news", max_articles=5, quality_threshold=0.6)
@@ -696,17 +822,28 @@ def example_usage():
         harvester.save_dataset(articles, 'csv')
         
         print(f"\n✅ Example complete! Collected {len(articles)} articles")
+    elif harvester.skipped_seen:
+        print("✅ Example complete - no new articles since the last run")
     else:
         print("❌ Example failed - no articles collected")
+    
+    harvester.close()
 
 if __name__ == "__main__":
     import sys
     
+    # Optional seen-article index: --seen-db [path], off unless given
+    seen_db = None
+    if '--seen-db' in sys.argv:
+        position = sys.argv.index('--seen-db') + 1
+        has_path = position < len(sys.argv) and not sys.argv[position].startswith('--')
+        seen_db = sys.argv[position] if has_path else 'newsharvest_seen.db'
+    
     # Check if user wants example or interactive mode
-    if len(sys.argv) > 1 and sys.argv[1] == '--example':
-        example_usage()
+    if '--example' in sys.argv:
+        example_usage(seen_db)
     else:
-        main()
+        main(seen_db)
 
 # Quick test URLs for copy-paste:
 """
@@ -718,7 +855,7 @@ Recommended test URLs:
 - https://www.theguardian.com/us
 
 Usage:
-1. python newsharvest_simple.py
+1. python newsharvest_simple.py  (add --seen-db to skip articles collected in earlier runs)
 2. Enter a news URL
 3. Choose number of articles (5-20 recommended)
 4. Choose quality threshold (0.6 recommended)